@@ -1,34 +1,183 @@
+import queue
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
+from typing import TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import dlt
 import requests
+from dlt.common import json
 from dlt.sources.helpers.requests import Client
 
+from ._http_cache import ETagCache
 from ._logging import logger
 
+API_URL = "https://api.github.com/"
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+T = TypeVar("T")
+R = TypeVar("R")
+Y = TypeVar("Y")
+
+# Upper bound for requests in flight against the GitHub API at any time.
+# GitHub's secondary rate limits penalise large bursts of concurrent requests.
+MAX_CONCURRENT_REQUESTS = 16
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Secondary rate limits (e.g. too many concurrent requests) answer with 403 and a `Retry-After` header.
+# Unlike an exhausted primary rate limit they clear within minutes, so wait and retry instead of failing.
+SECONDARY_RATE_LIMIT_MAX_RETRIES = 3
+SECONDARY_RATE_LIMIT_MAX_WAIT = 120
+
+# GitHub also applies secondary rate limits to more than 900 REST API points per minute (a GET costs one).
+# Keep the requests sent within any one minute below that instead of waiting for the 403 replies.
+# GraphQL queries are limited by a separate points budget, so they are not counted.
+MAX_REQUESTS_PER_MINUTE = 900
+_request_times: deque[float] = deque()
+_request_times_lock = threading.Lock()
+
+# Largest page size the GitHub REST API allows for list endpoints
+MAX_PAGE_SIZE = 100
+
+# Statistics endpoints answer `202 Accepted` while GitHub computes the data in the background.
+# Retry such requests a few times with exponential backoff (2s, 4s, 8s) before giving up.
+ACCEPTED_MAX_RETRIES = 3
+
 # Configure DLT requests client with retry settings
 # This client automatically retries 429 errors and respects Retry-After headers
+# All threads share the client's connection pool, so size it for the maximum concurrency
 http_client = Client(
     request_timeout=60,
+    max_connections=MAX_CONCURRENT_REQUESTS,
     request_max_attempts=5,
     request_backoff_factor=1,
     request_max_retry_delay=300,
     raise_for_status=False,  # We'll handle status codes manually for better error messages
 )
 
+# Long-lived pool for fetching the pages of an endpoint concurrently, so paginated requests (which
+# run inside the per-repository tasks of `map_concurrently`) do not start new threads every time.
+# Connection reuse does not depend on it: the per-thread sessions of http_client all mount the same
+# HTTPAdapter, so any thread shares its keep-alive pool, which is why `map_concurrently` can create
+# short-lived executors. Only page fetches run here, so tasks never wait on other tasks of the same pool.
+_page_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="github-pages")
+
+
+class TokenPool:
+    """One or more GitHub API tokens, each with its own rate limit budget
+
+    Requests keep using the current token until its remaining budget (tracked from the
+    `X-RateLimit-Remaining` response headers) drops below `min_remaining`, then move on to the
+    next token with budget left. If no token has `min_remaining` left, the current token is used
+    until it is exhausted, then the one with the largest known budget, until all of them are.
+    With a single token this is a no-op.
+
+    The REST API (`core`) and GraphQL API (`graphql`) have separate rate limits, so the budgets
+    are tracked per token and resource, as reported in the `X-RateLimit-Resource` header.
+    """
+
+    def __init__(self, min_remaining: int = 50):
+        self.min_remaining = min_remaining
+        self._tokens: list[str] = []
+        self._remaining: dict[tuple[str, str], int] = {}
+        self._index = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @property
+    def tokens(self) -> list[str]:
+        return list(self._tokens)
+
+    def set_tokens(self, tokens: list[str]) -> None:
+        with self._lock:
+            self._tokens = tokens
+            self._remaining = {}
+            self._index = 0
+
+    def current(self, resource: str = "core") -> str | None:
+        """Return the token to use for the next request to `resource`, or None if no tokens are configured"""
+        with self._lock:
+            if not self._tokens:
+                return None
+            budgets = [self._remaining.get((token, resource), self.min_remaining) for token in self._tokens]
+            for offset in range(len(self._tokens)):
+                index = (self._index + offset) % len(self._tokens)
+                if budgets[index] >= self.min_remaining:
+                    break
+            else:
+                # No token has `min_remaining` left: drain the current one, then the one with the most budget
+                index = self._index
+                if budgets[index] <= 0:
+                    index = max(range(len(self._tokens)), key=budgets.__getitem__)
+                    if budgets[index] <= 0:
+                        index = self._index
+            if index != self._index:
+                logger.debug(f"Switching to GitHub token {index + 1}/{len(self._tokens)}")
+                self._index = index
+            return self._tokens[self._index]
+
+    def record(self, token: str, response: requests.Response) -> None:
+        """Update the remaining budget of `token` from a response"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        resource = response.headers.get("X-RateLimit-Resource", "core")
+        if remaining is not None and remaining.isdigit():
+            with self._lock:
+                self._remaining[(token, resource)] = int(remaining)
+
+    def has_budget(self, resource: str = "core") -> bool:
+        """True if any token is not known to be exhausted for `resource`"""
+        with self._lock:
+            return any(self._remaining.get((token, resource), 1) > 0 for token in self._tokens)
+
+
+token_pool = TokenPool()
+
+# Endpoints whose response bodies are not written to the ETag cache, which is kept between CI runs:
+# - the authenticated user, the organization's repository listing (which includes private repos),
+#   organization members (including concealed ones), repository traffic and statistics, and the
+#   comments of issues (which may belong to private repos) are only visible with elevated access
+#   and must not end up in a cache that is readable by other workflows
+# - issue and commit listings are only requested in full on the first run of a repository and with a
+#   changing `since` afterwards, so their pages would never be requested again
+UNCACHED_ENDPOINTS = re.compile(
+    r"^/user$|^/orgs/[^/]+/repos$|/(members|traffic/[^/]+|stats/[^/]+|issues|comments|commits)$"
+)
+
+# Responses of the REST API are cached across runs to make conditional requests.
+# Override the location with SOURCES__GITHUB_PIPELINE__ETAG_CACHE_PATH.
+etag_cache = ETagCache(dlt.config.get("sources.github_pipeline.etag_cache_path") or ".cache/github_etags.sqlite")
+
 
 def get_github_headers(api_token: str = dlt.secrets["sources.github_pipeline.github.api_token"]) -> dict:
-    """Get GitHub API headers with authentication"""
-    if not api_token:
+    """Get GitHub API headers with authentication
+
+    `api_token` may hold several comma-separated tokens. Requests made through `github_request`
+    and `graphql_request` then move on to the next token when one runs out of rate limit.
+    """
+    tokens = [token.strip() for token in (api_token or "").split(",") if token.strip()]
+    if not tokens:
         raise ValueError(
             "GitHub API token is not configured. Please set SOURCES__GITHUB_PIPELINE__GITHUB__API_TOKEN in your secrets."
         )
-    return {"Authorization": f"token {api_token}", "Accept": "application/vnd.github.v3+json"}
+    token_pool.set_tokens(tokens)
+    return {"Authorization": f"token {tokens[0]}", "Accept": "application/vnd.github.v3+json"}
 
 
 def check_rate_limit(headers: dict, min_remaining: int = 100) -> dict:
     """Check GitHub API rate limit status
 
+    If several tokens are configured, the budgets of all tokens are added up.
+
     Args:
         headers: GitHub API headers
         min_remaining: Minimum requests that should remain
@@ -36,13 +185,20 @@ def check_rate_limit(headers: dict, min_remaining: int = 100) -> dict:
     Returns:
         dict with 'remaining', 'limit', 'reset' keys
     """
-    response = http_client.get("https://api.github.com/rate_limit", headers=headers)
-    response.raise_for_status()
-    rate_limit = response.json()["resources"]["core"]
+    remaining = limit = 0
+    reset_time = None
+    for token in token_pool.tokens or [None]:
+        request_headers = {**headers, "Authorization": f"token {token}"} if token else headers
+        response = http_client.get("https://api.github.com/rate_limit", headers=request_headers)
+        response.raise_for_status()
+        rate_limit = json.loadb(response.content)["resources"]["core"]
+        if token:
+            token_pool.record(token, response)
+
+        remaining += rate_limit["remaining"]
+        limit += rate_limit["limit"]
+        reset_time = rate_limit["reset"] if reset_time is None else min(reset_time, rate_limit["reset"])
 
-    remaining = rate_limit["remaining"]
-    limit = rate_limit["limit"]
-    reset_time = rate_limit["reset"]
     reset_datetime = datetime.fromtimestamp(reset_time, tz=timezone.utc)
 
     logger.info(f"Rate limit: {remaining}/{limit} remaining (resets at {reset_datetime})")
@@ -53,35 +209,24 @@ def check_rate_limit(headers: dict, min_remaining: int = 100) -> dict:
     return {"remaining": remaining, "limit": limit, "reset": reset_time}
 
 
-def github_request(url: str, headers: dict) -> requests.Response:
-    """Make GitHub API request with rate limit handling using DLT's retry-enabled client
+def _is_rate_limit_exhausted(response: requests.Response) -> bool:
+    return response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0"
 
-    The http_client automatically:
-    - Retries 429 (rate limit) errors with exponential backoff
-    - Respects Retry-After headers from GitHub
-    - Retries transient network errors and 5xx server errors
-    - Uses configurable backoff (1s, 2s, 4s, 8s, 16s)
-
-    Note: For actual rate limit exhaustion (403 with X-RateLimit-Remaining: 0),
-    we fail fast to let DLT's incremental loading resume on the next run.
-    """
-    response = http_client.get(url, headers=headers)
 
+def _raise_for_status(response: requests.Response) -> None:
+    """Raise for error responses, failing fast with a clear message when the rate limit is exhausted"""
     # Check for rate limit exhaustion using GitHub-specific headers
     # 403 with X-RateLimit-Remaining: 0 indicates true rate limit exhaustion
-    if response.status_code == 403:
-        remaining = response.headers.get("X-RateLimit-Remaining")
+    # Only fail fast if we're truly rate limited (remaining = 0)
+    # Other 403s (permissions, etc.) will be handled by raise_for_status
+    if _is_rate_limit_exhausted(response):
         reset_time = response.headers.get("X-RateLimit-Reset")
-
-        # Only fail fast if we're truly rate limited (remaining = 0)
-        # Other 403s (permissions, etc.) will be handled by raise_for_status
-        if remaining is not None and int(remaining) == 0:
-            reset_datetime = datetime.fromtimestamp(int(reset_time), tz=timezone.utc) if reset_time else "unknown"
-            logger.error(f"Rate limit exhausted. Resets at {reset_datetime}. Failing fast to resume on next run.")
-            raise requests.HTTPError(
-                f"GitHub API rate limit exhausted. Resets at {reset_datetime}. Pipeline will resume on next scheduled run.",
-                response=response,
-            )
+        reset_datetime = datetime.fromtimestamp(int(reset_time), tz=timezone.utc) if reset_time else "unknown"
+        logger.error(f"Rate limit exhausted. Resets at {reset_datetime}. Failing fast to resume on next run.")
+        raise requests.HTTPError(
+            f"GitHub API rate limit exhausted. Resets at {reset_datetime}. Pipeline will resume on next scheduled run.",
+            response=response,
+        )
 
     # DLT client handles 429 automatically with retries, but if it still fails after retries, we should fail fast
     if response.status_code == 429:
@@ -96,26 +241,314 @@ def github_request(url: str, headers: dict) -> requests.Response:
         )
 
     response.raise_for_status()
+
+
+def _sleep_with_jitter(seconds: float) -> None:
+    """Sleep for `seconds` plus up to 10% more, so concurrent workers do not all retry at the same moment"""
+    time.sleep(seconds * random.uniform(1.0, 1.1))
+
+
+def _secondary_rate_limit_wait(response: requests.Response) -> int | None:
+    """Seconds to wait before retrying a request rejected by a secondary rate limit, or None"""
+    retry_after = response.headers.get("Retry-After", "")
+    if response.status_code != 403 or not retry_after.isdigit() or _is_rate_limit_exhausted(response):
+        return None
+    return min(int(retry_after), SECONDARY_RATE_LIMIT_MAX_WAIT)
+
+
+def _wait_for_request_window() -> None:
+    """Block until another request fits into the last minute's budget of MAX_REQUESTS_PER_MINUTE"""
+    while True:
+        with _request_times_lock:
+            now = time.monotonic()
+            while _request_times and _request_times[0] <= now - 60:
+                _request_times.popleft()
+            if len(_request_times) < MAX_REQUESTS_PER_MINUTE:
+                _request_times.append(now)
+                return
+            wait = _request_times[0] + 60 - now
+        logger.debug(f"Sent {MAX_REQUESTS_PER_MINUTE} requests within the last minute, waiting {wait:.1f}s")
+        time.sleep(wait)
+
+
+def _request(method: str, url: str, headers: dict, **kwargs) -> requests.Response:
+    """Send a single request, waiting out secondary rate limits"""
+    for attempt in range(SECONDARY_RATE_LIMIT_MAX_RETRIES + 1):
+        if url.startswith(API_URL) and url != GRAPHQL_URL:
+            _wait_for_request_window()
+        with _request_slots:
+            response = http_client.request(method, url, headers=headers, **kwargs)
+        wait = _secondary_rate_limit_wait(response)
+        if wait is None or attempt == SECONDARY_RATE_LIMIT_MAX_RETRIES:
+            break
+        logger.warning(f"Secondary rate limit hit for {url}, retrying in {wait}s")
+        _sleep_with_jitter(wait)
     return response
 
 
+def _send(method: str, url: str, headers: dict, **kwargs) -> requests.Response:
+    """Send a request with the current token of the pool, switching tokens if its rate limit is exhausted"""
+    resource = "graphql" if url == GRAPHQL_URL else "core"
+    for _ in range(max(len(token_pool), 1)):
+        token = token_pool.current(resource) if "Authorization" in headers else None
+        request_headers = {**headers, "Authorization": f"token {token}"} if token else headers
+
+        response = _request(method, url, request_headers, **kwargs)
+        if token is None:
+            break
+        token_pool.record(token, response)
+        if not (_is_rate_limit_exhausted(response) and token_pool.has_budget(resource)):
+            break
+        logger.warning("Rate limit exhausted for current GitHub token, retrying with the next one")
+
+    return response
+
+
+def _is_cacheable(url: str) -> bool:
+    """True for REST API URLs whose responses may be kept in the ETag cache
+
+    Requests that are not repeated on the next run are skipped, as caching them would only grow
+    the cache: incremental requests carry a `since` timestamp that changes on every run, and the
+    full listings of the same endpoints are only requested once. Endpoints in UNCACHED_ENDPOINTS
+    are never stored, see there.
+    """
+    if not url.startswith(API_URL):
+        return False
+    parts = urlsplit(url)
+    return not UNCACHED_ENDPOINTS.search(parts.path) and not any(key == "since" for key, _ in parse_qsl(parts.query))
+
+
+def github_request(url: str, headers: dict) -> requests.Response:
+    """Make GitHub API request with rate limit handling using DLT's retry-enabled client
+
+    The http_client automatically:
+    - Retries 429 (rate limit) errors with exponential backoff
+    - Respects Retry-After headers from GitHub
+    - Retries transient network errors and 5xx server errors
+    - Uses configurable backoff (1s, 2s, 4s, 8s, 16s)
+
+    `202 Accepted` replies of the statistics endpoints are retried until the data is ready,
+    see ACCEPTED_MAX_RETRIES.
+
+    Requests to the REST API are conditional: if the ETag of an earlier response is cached,
+    it is sent as `If-None-Match` and a `304 Not Modified` reply (which does not count against
+    the rate limit) is answered from the cache.
+
+    Note: For actual rate limit exhaustion (403 with X-RateLimit-Remaining: 0) of all
+    configured tokens, we fail fast to let DLT's incremental loading resume on the next run.
+    """
+    cacheable = _is_cacheable(url)
+    accept = headers.get("Accept", "")
+    cached = etag_cache.get(url, accept) if cacheable else None
+    if cached:
+        headers = {**headers, "If-None-Match": cached.etag}
+
+    response = _send("GET", url, headers)
+    for attempt in range(1, ACCEPTED_MAX_RETRIES + 1):
+        if response.status_code != 202:
+            break
+        delay = 2**attempt
+        logger.info(f"GitHub is still computing {url}, retrying in {delay}s")
+        _sleep_with_jitter(delay)
+        response = _send("GET", url, headers)
+
+    if cached and response.status_code == 304:
+        logger.debug(f"Not modified, using cached response for {url}")
+        etag_cache.touch(url, accept)
+        return cached.to_response(response)
+
+    _raise_for_status(response)
+    if cacheable and response.status_code == 200:
+        etag_cache.put(url, response, accept)
+    return response
+
+
+def graphql_request(query: str, variables: dict, headers: dict) -> dict:
+    """Run a query against the GitHub GraphQL API and return its `data`
+
+    Uses the same retry and rate limit handling as `github_request`. Errors for individual
+    fields (e.g. a deleted issue) are logged and leave those fields `null`; the request only
+    fails if no data is returned at all.
+    """
+    response = _send("POST", GRAPHQL_URL, headers, json={"query": query, "variables": variables})
+
+    _raise_for_status(response)
+    payload = json.loadb(response.content)
+
+    if payload.get("errors"):
+        if payload.get("data") is None:
+            raise requests.HTTPError(f"GitHub GraphQL query failed: {payload['errors']}", response=response)
+        logger.warning(f"GitHub GraphQL query returned partial data: {payload['errors']}")
+
+    return payload["data"]
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = MAX_CONCURRENT_REQUESTS
+) -> Iterator[R]:
+    """Apply `func` to all items using a thread pool and yield the results in input order
+
+    Meant for I/O-bound per-repository fetches: the requests wait on the network concurrently,
+    while `github_request` keeps the total number of in-flight requests bounded.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(func, items)
+
+
+def stream_concurrently(
+    func: Callable[[T], Generator[Y, None, R]],
+    items: Iterable[T],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+    max_buffered: int = 1000,
+) -> Iterator[tuple[int, bool, Y | R]]:
+    """Run the generator function `func` on all items using a thread pool and yield its values as they come
+
+    Unlike `map_concurrently`, the values of an item are not collected before they are handed over:
+    the workers pass them on through a queue of at most `max_buffered` values and wait while it is
+    full, so memory stays bounded however much an item produces. Values of different items are interleaved.
+
+    Yields:
+        `(index, False, value)` for every value `func` yields for the item at `index`, and
+        `(index, True, result)` with the return value of `func` once it is done with that item
+    """
+    items = list(items)
+    buffer = queue.Queue(maxsize=max_buffered)
+    stopped = threading.Event()
+
+    def put(entry: tuple) -> None:
+        # Give up once the consumer is gone instead of waiting on a full queue forever
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=1)
+                return
+            except queue.Full:
+                pass
+
+    def run(index: int, item: T) -> None:
+        try:
+            generator = func(item)
+            while not stopped.is_set():
+                try:
+                    value = next(generator)
+                except StopIteration as done:
+                    put((index, "result", done.value))
+                    return
+                put((index, "value", value))
+        except Exception as e:
+            put((index, "error", e))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for index, item in enumerate(items):
+                executor.submit(run, index, item)
+            pending = len(items)
+            while pending:
+                index, kind, value = buffer.get()
+                if kind == "error":
+                    raise value
+                if kind == "result":
+                    pending -= 1
+                yield index, kind == "result", value
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Group an iterable into lists of at most `size` items"""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _fetch_page(url: str, headers: dict) -> tuple[list[dict] | dict, dict]:
+    """Fetch one page of a GitHub API endpoint and return its data and pagination links
+
+    Search responses are unwrapped to their `items`. The raw response body is released right
+    away, so only the parsed page is held while the caller consumes it.
+    """
+    response = github_request(url, headers)
+    # dlt's json module decodes the raw bytes with orjson, which is much faster than `response.json()`
+    data = json.loadb(response.content)
+    if isinstance(data, dict) and "items" in data:
+        data = data["items"]
+    return data, response.links
+
+
+def _page_url(url: str, page: int) -> str:
+    """Set the `page` query parameter of a paginated GitHub API URL"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "page"]
+    return urlunsplit(parts._replace(query=urlencode([*query, ("page", str(page))])))
+
+
+def _with_page_size(url: str) -> str:
+    """Request the maximum page size of the REST API, unless the URL already sets one"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not url.startswith(API_URL) or any(key == "per_page" for key, _ in query):
+        return url
+    return urlunsplit(parts._replace(query=urlencode([*query, ("per_page", str(MAX_PAGE_SIZE))])))
+
+
+def _page_number(url: str | None) -> int | None:
+    page = dict(parse_qsl(urlsplit(url).query)).get("page") if url else None
+    return int(page) if page and page.isdigit() else None
+
+
+def _iter_pages(url: str, headers: dict) -> Iterator[list[dict] | dict]:
+    """Yield all pages of a GitHub API endpoint, one page of data at a time
+
+    Pages hold `MAX_PAGE_SIZE` items unless the URL sets `per_page` itself (the API default is 30).
+    The `last` link of the first page reveals the total number of pages, so the remaining pages
+    are fetched concurrently, a window of `MAX_CONCURRENT_REQUESTS` pages at a time, and yielded
+    in order. Endpoints without a `last` link are walked serially through their `next` links.
+
+    A non-paginated response (neither a list nor a search result) is yielded as-is and ends
+    the iteration.
+    """
+    data, links = _fetch_page(_with_page_size(url), headers)
+    if not isinstance(data, list):
+        yield data  # Non-paginated response
+        return
+    yield data
+
+    next_url = links.get("next", {}).get("url")
+    last_page = _page_number(links.get("last", {}).get("url"))
+    if next_url and last_page:
+        page_urls = (_page_url(next_url, page) for page in range(2, last_page + 1))
+        for window in batched(page_urls, MAX_CONCURRENT_REQUESTS):
+            for data, _ in _page_executor.map(partial(_fetch_page, headers=headers), window):
+                yield data
+        return
+
+    while next_url:
+        data, links = _fetch_page(next_url, headers)
+        yield data
+        next_url = links.get("next", {}).get("url")
+
+
+def iter_paginated_data(url: str, headers: dict) -> Iterator[dict]:
+    """Lazily yield all paginated results from GitHub API
+
+    Only the current page is held in memory, so callers that consume results once should
+    prefer this over `get_paginated_data`. Non-paginated responses yield nothing.
+    """
+    for page in _iter_pages(url, headers):
+        if not isinstance(page, list):
+            logger.debug(f"Ignoring non-paginated response from {url}")
+            return
+        yield from page
+
+
 def get_paginated_data(url: str, headers: dict):
     """Get all paginated results from GitHub API"""
     all_results = []
 
-    while url:
-        response = github_request(url, headers)
-        data = response.json()
-
-        # Handle different response formats
-        if isinstance(data, dict) and "items" in data:
-            all_results.extend(data["items"])
-        elif isinstance(data, list):
-            all_results.extend(data)
-        else:
-            return data  # Non-paginated response
-
-        url = response.links.get("next", {}).get("url")
+    for page in _iter_pages(url, headers):
+        if not isinstance(page, list):
+            return page  # Non-paginated response
+        all_results.extend(page)
 
     return all_results
 
@@ -131,35 +564,21 @@ def get_file_contents(owner: str, repo: str, path: str, headers: dict, ref: str
         ref: Git reference (branch, tag, or commit SHA). If None, uses the repository's default branch
 
     Returns:
-        The decoded file contents as a string
+        The file contents as a string
 
     Raises:
         requests.HTTPError: If the file is not found or other API errors
+        UnicodeDecodeError: If the file is not valid UTF-8
     """
-    import base64
-
-    # If no ref specified, get the repository's default branch
-    if ref is None:
-        repo_url = f"https://api.github.com/repos/{owner}/{repo}"
-        repo_response = http_client.get(repo_url, headers=headers)
-        repo_response.raise_for_status()
-        ref = repo_response.json()["default_branch"]
-        logger.debug(f"Using default branch '{ref}' for {owner}/{repo}")
-
     # Remove leading slash if present
     path = path.lstrip("/")
 
+    # Build the full URL so that unchanged files are answered from the ETag cache.
+    # Without a ref, GitHub resolves the default branch itself, saving a lookup of the repository.
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-    params = {"ref": ref}
-
-    response = http_client.get(url, headers=headers, params=params)
-    response.raise_for_status()
-
-    data = response.json()
+    if ref is not None:
+        url += f"?{urlencode({'ref': ref})}"
 
-    # GitHub returns base64-encoded content
-    if "content" in data:
-        content = base64.b64decode(data["content"]).decode("utf-8")
-        return content
-    else:
-        raise ValueError(f"No content found in response for {owner}/{repo}/{path}")
+    # Ask for the raw file instead of JSON with base64-encoded content, which is a third larger
+    # and would have to be parsed and decoded again
+    return github_request(url, {**headers, "Accept": "application/vnd.github.raw+json"}).content.decode("utf-8")
@@ -0,0 +1,99 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ._logging import logger
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    headers: dict
+    body: bytes
+
+    def to_response(self, not_modified: requests.Response) -> requests.Response:
+        """Rebuild a full response from the cache for a `304 Not Modified` reply"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        return response
+
+
+class ETagCache:
+    """Persistent SQLite store of response bodies and their ETags, keyed by URL and `Accept` header
+
+    The same URL can return different representations depending on the `Accept` header (e.g. the raw
+    file or base64 encoded JSON for repository contents), so both are part of the key.
+
+    GitHub answers requests carrying a matching `If-None-Match` header with `304 Not Modified`,
+    which does not count against the rate limit. The cached body is then used instead.
+    The database is opened lazily and is safe to use from multiple threads.
+
+    Entries that have not been fetched or confirmed by a `304` for `max_age` are evicted when
+    the database is opened, so URLs that are no longer requested do not pile up.
+    """
+
+    def __init__(self, path: str | Path, max_age: timedelta = timedelta(days=30)):
+        self.path = Path(path)
+        self.max_age = max_age
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS etag_cache "
+                "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, fetched_at TIMESTAMP)"
+            )
+            cutoff = (datetime.now(timezone.utc) - self.max_age).isoformat()
+            with self._connection:
+                evicted = self._connection.execute("DELETE FROM etag_cache WHERE fetched_at < ?", (cutoff,)).rowcount
+            logger.info(f"Using ETag cache at {self.path}, evicted {evicted} stale entries")
+        return self._connection
+
+    @staticmethod
+    def _key(url: str, accept: str) -> str:
+        return f"{url} {accept}" if accept else url
+
+    def get(self, url: str, accept: str = "") -> CachedResponse | None:
+        key = self._key(url, accept)
+        with self._lock:
+            row = self._connect().execute("SELECT etag, headers, body FROM etag_cache WHERE url = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        etag, headers, body = row
+        return CachedResponse(etag, json.loads(headers), body)
+
+    def put(self, url: str, response: requests.Response, accept: str = "") -> None:
+        etag = response.headers.get("ETag")
+        if not etag:
+            return
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO etag_cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._key(url, accept),
+                    etag,
+                    json.dumps(dict(response.headers)),
+                    response.content,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+    def touch(self, url: str, accept: str = "") -> None:
+        """Mark the entry of `url` as confirmed by a `304 Not Modified` reply, so it is not evicted"""
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "UPDATE etag_cache SET fetched_at = ? WHERE url = ?",
+                (datetime.now(timezone.utc).isoformat(), self._key(url, accept)),
+            )
@@ -29,4 +29,4 @@ def log_pipeline_stats(pipeline, load_info):
                     logger.info(f"  {job_type}: {len(jobs)} jobs")
 
     logger.info("=== DLT LOAD INFO ===")
-    print(load_info)
+    logger.info(load_info)
@@ -1,13 +1,25 @@
-import itertools
+import re
 from datetime import datetime, timezone
+from functools import partial
 
 import dlt
 import requests
 from semanticscholar import SemanticScholar, SemanticScholarException
+from semanticscholar.Paper import Paper
 
-from ._github import get_file_contents, get_github_headers, github_request
+from ._github import batched, get_file_contents, get_github_headers, github_request, map_concurrently
 from ._logging import log_pipeline_stats, logger
 
+# Start of the manifest section in a nextflow.config
+MANIFEST_RE = re.compile(r"manifest\s*\{")
+# Match: doi = 'https://doi.org/10.1371/journal.pcbi.1012265'
+# or:    doi = '10.1371/journal.pcbi.1012265'
+DOI_RE = re.compile(r"doi\s*=\s*['\"](?:https?://doi\.org/)?([0-9]+\.[0-9]+/[^'\"]+)['\"]")
+
+# Largest number of IDs the Semantic Scholar batch endpoint accepts per request
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500
+PAPER_FIELDS = ["externalIds", "title", "citationCount", "influentialCitationCount"]
+
 
 def _get_pipeline_names(headers) -> list[str]:
     pipeline_names_url = "https://raw.githubusercontent.com/nf-core/website/main/public/pipeline_names.json"
@@ -18,6 +30,52 @@ def _get_pipeline_names(headers) -> list[str]:
         raise
 
 
+def _extract_block(text: str, start: int) -> str | None:
+    """Return the contents of the block opened by the `{` right before `start`
+
+    Walks the text once, counting nested braces and skipping over quoted strings and `//` and
+    `/* */` comments, instead of matching the block with a backtracking regex.
+
+    Returns:
+        The text between the braces, or None if the block is never closed
+    """
+    depth = 1
+    quote = None
+    escaped = False
+    in_comment = False
+    block_comment_end = None
+    for i in range(start, len(text)):
+        char = text[i]
+        if block_comment_end is not None:
+            if i == block_comment_end:
+                block_comment_end = None
+        elif in_comment:
+            in_comment = char != "\n"
+        elif quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif text.startswith("//", i):
+            in_comment = True
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            if end == -1:
+                return None
+            block_comment_end = end + 1
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i]
+    return None
+
+
 def _parse_doi_from_nextflow_config(file_contents) -> str | None:
     """Parse DOI from nextflow.config manifest section
 
@@ -30,66 +88,69 @@ def _parse_doi_from_nextflow_config(file_contents) -> str | None:
     Returns:
         The DOI string (e.g., '10.1371/journal.pcbi.1012265') or None if not found
     """
-    import re
-
     # First, extract the manifest section
     # Match from 'manifest {' to the closing '}'
-    manifest_pattern = r"manifest\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}"
-    manifest_match = re.search(manifest_pattern, file_contents, re.DOTALL)
-
+    manifest_match = MANIFEST_RE.search(file_contents)
     if not manifest_match:
         return None
 
-    manifest_content = manifest_match.group(1)
+    manifest_content = _extract_block(file_contents, manifest_match.end())
+    if manifest_content is None:
+        return None
 
     # Now look for the doi field within the manifest section
-    # Match: doi = 'https://doi.org/10.1371/journal.pcbi.1012265'
-    # or:    doi = '10.1371/journal.pcbi.1012265'
-    doi_pattern = r"doi\s*=\s*['\"](?:https?://doi\.org/)?([0-9]+\.[0-9]+/[^'\"]+)['\"]"
-
-    doi_match = re.search(doi_pattern, manifest_content)
+    doi_match = DOI_RE.search(manifest_content)
     if doi_match:
         return doi_match.group(1)
 
     return None
 
 
-def _get_citations_for_pipeline(pipeline_name: str, github_headers: dict):
+def _get_dois_for_pipeline(github_headers: dict, pipeline_name: str) -> list[str]:
+    """Get the DOIs listed in the manifest of a pipeline's `nextflow.config`"""
     try:
         nextflow_config = get_file_contents("nf-core", pipeline_name, "nextflow.config", github_headers)
     except (requests.HTTPError, ValueError) as e:
+        # ValueError includes the UnicodeDecodeError of a file that is not valid UTF-8
         logger.error(f"Failed to get nextflow.config for {pipeline_name}: {e}")
-        return
+        return []
 
     # multiple dois might be separated by commata
     doi_str = _parse_doi_from_nextflow_config(nextflow_config)
     if doi_str is None:
         logger.info(f"No doi found in `nextflow.config` for {pipeline_name}")
-        return
+        return []
 
-    dois = [x.strip() for x in doi_str.split(",")]
+    # drop repeated dois, keeping their order
+    return list(dict.fromkeys(x.strip() for x in doi_str.split(",")))
 
-    sch = SemanticScholar()
-    for doi in dois:
+
+def _get_papers_by_doi(sch: SemanticScholar, dois: list[str]) -> dict[str, Paper]:
+    """Look up papers in batches of up to SEMANTIC_SCHOLAR_BATCH_SIZE DOIs
+
+    The batch endpoint drops IDs it does not know, so the papers are matched back to the
+    requested DOIs through their external IDs. DOIs are case-insensitive and keyed in lower case.
+    """
+    papers = {}
+    for batch in batched(dois, SEMANTIC_SCHOLAR_BATCH_SIZE):
         try:
-            # TODO consider using a semantischolar API key for more reliable queries
-            # > Most Semantic Scholar endpoints are available to the public without authentication,
-            # > but they are rate-limited to 1000 requests per second shared among all unauthenticated users.
-            # > Requests may also be further throttled during periods of heavy use.
-            #
-            # When using an API key we get an guaranteed rate limit of one request per second
-            # (https://www.semanticscholar.org/product/api)
-            paper = sch.get_paper(doi)
-            yield {
-                "pipeline_name": pipeline_name,
-                "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-                "doi": doi,
-                "paper_title": paper.title,
-                "citation_count": paper.citationCount,
-                "influencial_paper_citation_count": paper.influentialCitationCount,
-            }
-        except SemanticScholarException.ObjectNotFoundException:
-            logger.warning(f"DOI not found: {doi}")
+            found = sch.get_papers([f"DOI:{doi}" for doi in batch], fields=PAPER_FIELDS)
+        except SemanticScholarException.BadQueryParametersException:
+            # raised when none of the DOIs of the batch were found
+            continue
+        for paper in found:
+            doi = (paper.externalIds or {}).get("DOI")
+            if doi:
+                papers[doi.lower()] = paper
+    return papers
+
+
+def _get_paper(sch: SemanticScholar, doi: str) -> Paper | None:
+    try:
+        return sch.get_paper(doi, fields=PAPER_FIELDS)
+    except SemanticScholarException.ObjectNotFoundException:
+        logger.warning(f"DOI not found: {doi}")
+        return None
 
 
 @dlt.source(name="semanticscholar")
@@ -102,9 +163,38 @@ def semanticscholar_source():
 
 @dlt.resource(write_disposition="merge", primary_key=["pipeline_name", "doi", "timestamp"])
 def pipeline_citations(pipelines: list[str], github_headers: dict):
-    yield from itertools.chain.from_iterable(
-        _get_citations_for_pipeline(pipeline, github_headers) for pipeline in pipelines
-    )
+    # The `nextflow.config` files are fetched from GitHub concurrently
+    pipeline_dois = list(zip(pipelines, map_concurrently(partial(_get_dois_for_pipeline, github_headers), pipelines)))
+
+    # TODO consider using a semantischolar API key for more reliable queries
+    # > Most Semantic Scholar endpoints are available to the public without authentication,
+    # > but they are rate-limited to 1000 requests per second shared among all unauthenticated users.
+    # > Requests may also be further throttled during periods of heavy use.
+    #
+    # When using an API key we get an guaranteed rate limit of one request per second
+    # (https://www.semanticscholar.org/product/api)
+    #
+    # Look up the DOIs of all pipelines with a few batch requests instead of one request per DOI
+    sch = SemanticScholar()
+    all_dois = list(dict.fromkeys(doi for _, dois in pipeline_dois for doi in dois))
+    papers = _get_papers_by_doi(sch, all_dois)
+
+    for pipeline, dois in pipeline_dois:
+        for doi in dois:
+            # Fall back to a single lookup for DOIs that could not be matched to a paper of the batch
+            if doi.lower() not in papers:
+                papers[doi.lower()] = _get_paper(sch, doi)
+            paper = papers[doi.lower()]
+            if paper is None:
+                continue
+            yield {
+                "pipeline_name": pipeline,
+                "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+                "doi": doi,
+                "paper_title": paper.title,
+                "citation_count": paper.citationCount,
+                "influencial_paper_citation_count": paper.influentialCitationCount,
+            }
 
 
 def main(*, destination="motherduck"):
@@ -1,14 +1,43 @@
+import calendar
+import heapq
 import io
 import logging
 import zipfile
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Generator, Iterator
 from datetime import datetime, timedelta, timezone
+from functools import cache, partial
 from typing import Literal
 
 import dlt
 import requests
-
-from ._github import check_rate_limit, get_github_headers, get_paginated_data, github_request
+from dlt.common import json
+
+from ._github import (
+    batched,
+    check_rate_limit,
+    get_github_headers,
+    get_paginated_data,
+    github_request,
+    graphql_request,
+    iter_paginated_data,
+    map_concurrently,
+    stream_concurrently,
+)
+
+# How long the `size` of a repository may lag behind its pushes before a size of 0 means it is empty
+EMPTY_REPO_GRACE_PERIOD = timedelta(days=7)
+# Issues per GraphQL query when looking up first responses
+FIRST_RESPONSE_BATCH_SIZE = 50
+# Comments per issue included in that query before falling back to the REST API
+FIRST_COMMENTS_PER_ISSUE = 10
+# Login the REST API reports for comments of deleted users, whose author is null in GraphQL
+DELETED_USER_LOGIN = "ghost"
+
+# Repositories per GraphQL query when looking up pipeline releases
+RELEASE_SUMMARY_BATCH_SIZE = 50
+# How long a release summary is reused for a pipeline without new pushes before it is fetched again
+RELEASE_SUMMARY_MAX_AGE = timedelta(days=7)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -50,6 +79,43 @@ def github_source(organization: str = "nf-core", api_token: str = dlt.secrets.va
     ]
 
 
+def _parse_github_timestamp(timestamp: str) -> datetime:
+    """Parse a GitHub API timestamp (`YYYY-MM-DDTHH:MM:SSZ`) into a timezone-aware UTC datetime
+
+    Slicing the fixed-width format is several times faster than `datetime.strptime`,
+    which matters in the per-issue and per-commit loops.
+    """
+    return datetime(
+        int(timestamp[0:4]),
+        int(timestamp[5:7]),
+        int(timestamp[8:10]),
+        int(timestamp[11:13]),
+        int(timestamp[14:16]),
+        int(timestamp[17:19]),
+        tzinfo=timezone.utc,
+    )
+
+
+def _fetch_repo_traffic(organization: str, headers: dict, name: str) -> tuple[dict, dict] | None:
+    """Fetch the views and clones traffic data of a repository, or None if unavailable"""
+    views_url = f"https://api.github.com/repos/{organization}/{name}/traffic/views"
+    clones_url = f"https://api.github.com/repos/{organization}/{name}/traffic/clones"
+
+    try:
+        views_response = github_request(views_url, headers)
+        clones_response = github_request(clones_url, headers)
+        return json.loadb(views_response.content), json.loadb(clones_response.content)
+    except requests.RequestException as e:
+        # Traffic data requires push access - skip if not available
+        if "403" in str(e) or "Forbidden" in str(e):
+            logger.info(f"Skipping traffic data for {name} (requires push access)")
+        elif "404" in str(e):
+            logger.info(f"Skipping traffic data for {name} (not found)")
+        else:
+            logger.warning(f"Failed to get traffic data for {name}: {e}")
+        return None
+
+
 @dlt.resource(write_disposition="merge", primary_key=["pipeline_name", "timestamp"])
 def traffic_stats(
     organization: str, headers: dict, repos: list[dict], only_active_repos: bool = False, max_repos: int | None = None
@@ -68,13 +134,9 @@ def traffic_stats(
 
     if only_active_repos:
         # Only get traffic for repos that have been updated in the last 6 months and are not archived
-        six_months_ago = datetime.now(timezone.utc) - timedelta(days=180)
-        filtered_repos = [
-            repo
-            for repo in repos
-            if datetime.strptime(repo["updated_at"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc) > six_months_ago
-            and not repo["archived"]
-        ]
+        # GitHub timestamps are fixed-width UTC ISO 8601 strings, so they compare correctly as strings
+        six_months_ago = (datetime.now(timezone.utc) - timedelta(days=180)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        filtered_repos = [repo for repo in repos if not repo["archived"] and repo["updated_at"] > six_months_ago]
         logger.info(f"Filtered to {len(filtered_repos)} active repositories (updated in last 6 months)")
     else:
         # Process all repos, but skip archived ones
@@ -84,38 +146,29 @@ def traffic_stats(
         )
 
     # Sort by stars/activity to prioritize important repos
-    filtered_repos = sorted(filtered_repos, key=lambda x: x.get("stargazers_count", 0), reverse=True)
+    def stars(repo: dict) -> int:
+        return repo.get("stargazers_count", 0)
 
     if max_repos:
-        filtered_repos = filtered_repos[:max_repos]
+        filtered_repos = heapq.nlargest(max_repos, filtered_repos, key=stars)
         logger.info(f"Limited to top {max_repos} repositories by stars")
+    else:
+        filtered_repos = sorted(filtered_repos, key=stars, reverse=True)
 
     logger.info(f"Collecting traffic stats for {len(filtered_repos)} repositories")
 
     successful_repos = 0
     failed_repos = 0
 
-    for repo in filtered_repos:
-        name = repo["name"]
-
-        # Get views and clones
-        views_url = f"https://api.github.com/repos/{organization}/{name}/traffic/views"
-        clones_url = f"https://api.github.com/repos/{organization}/{name}/traffic/clones"
+    fetch_traffic = partial(_fetch_repo_traffic, organization, headers)
+    repo_names = [repo["name"] for repo in filtered_repos]
 
-        try:
-            views_data = github_request(views_url, headers).json()
-            clones_data = github_request(clones_url, headers).json()
-            successful_repos += 1
-        except requests.RequestException as e:
-            # Traffic data requires push access - skip if not available
-            if "403" in str(e) or "Forbidden" in str(e):
-                logger.info(f"Skipping traffic data for {name} (requires push access)")
-            elif "404" in str(e):
-                logger.info(f"Skipping traffic data for {name} (not found)")
-            else:
-                logger.warning(f"Failed to get traffic data for {name}: {e}")
+    for name, traffic in zip(repo_names, map_concurrently(fetch_traffic, repo_names)):
+        if traffic is None:
             failed_repos += 1
             continue
+        successful_repos += 1
+        views_data, clones_data = traffic
 
         # Get views and clones data
         views_list = views_data.get("views", [])
@@ -125,90 +178,295 @@ def traffic_stats(
             logger.debug(f"No traffic data available for {name}")
             continue
 
-        # Create a mapping of clone data by timestamp for efficient lookup
+        # Merge views and clones by timestamp; days missing on one side count as zero
+        views_by_timestamp = {v["timestamp"]: v for v in views_list}
         clones_by_timestamp = {c["timestamp"]: c for c in clones_list}
+        no_traffic = {"count": 0, "uniques": 0}
 
-        # Process views data and match with clones
-        for view in views_list:
-            timestamp = view["timestamp"]
-            clone_data = clones_by_timestamp.get(timestamp, {"count": 0, "uniques": 0})
-
+        for timestamp in sorted(views_by_timestamp.keys() | clones_by_timestamp.keys()):
+            view_data = views_by_timestamp.get(timestamp, no_traffic)
+            clone_data = clones_by_timestamp.get(timestamp, no_traffic)
             yield {
                 "pipeline_name": name,
                 "timestamp": timestamp,
-                "views": view["count"],
-                "views_uniques": view["uniques"],
+                "views": view_data["count"],
+                "views_uniques": view_data["uniques"],
                 "clones": clone_data["count"],
                 "clones_uniques": clone_data["uniques"],
             }
 
-        # Process clone data that doesn't have corresponding view data
-        for clone in clones_list:
-            timestamp = clone["timestamp"]
-            # Only yield if we haven't already processed this timestamp from views
-            if not any(view["timestamp"] == timestamp for view in views_list):
-                yield {
-                    "pipeline_name": name,
-                    "timestamp": timestamp,
-                    "views": 0,
-                    "views_uniques": 0,
-                    "clones": clone["count"],
-                    "clones_uniques": clone["uniques"],
-                }
-
     logger.info(f"Traffic stats completed: {successful_repos} successful, {failed_repos} failed/skipped")
 
 
+def _repos_with_commits(repos: list[dict]) -> list[dict]:
+    """Drop empty repositories, which have no commit history to collect
+
+    GitHub computes `size` lazily, so a repository that was created or pushed to recently can still
+    report 0 while already having commits. A size of 0 is only trusted once the last push (or the
+    creation, if there was none) is older than EMPTY_REPO_GRACE_PERIOD.
+    """
+    cutoff = datetime.now(timezone.utc) - EMPTY_REPO_GRACE_PERIOD
+
+    def is_empty(repo: dict) -> bool:
+        last_activity = repo.get("pushed_at") or repo.get("created_at")
+        return (
+            repo.get("size", 0) == 0 and last_activity is not None and _parse_github_timestamp(last_activity) < cutoff
+        )
+
+    non_empty = [repo for repo in repos if not is_empty(repo)]
+    if len(non_empty) < len(repos):
+        logger.info(f"Skipping {len(repos) - len(non_empty)} empty repositories")
+    return non_empty
+
+
+def _fetch_contributor_stats(organization: str, headers: dict, name: str) -> list[dict] | None:
+    """Fetch the weekly contributor statistics of a repository, or None if unavailable"""
+    stats_url = f"https://api.github.com/repos/{organization}/{name}/stats/contributors"
+    try:
+        stats = get_paginated_data(stats_url, headers)
+    except requests.RequestException as e:
+        logger.warning(f"Failed to get contributor stats for {name}: {e}")
+        return None
+    if not isinstance(stats, list):
+        logger.info(f"Contributor stats for {name} are not ready yet, skipping")
+        return None
+    return stats
+
+
 @dlt.resource(write_disposition="merge", primary_key=["pipeline_name", "author", "week_date"])
 def contributor_stats(organization: str, headers: dict, repos: list[dict]) -> Iterator[dict]:
     """Collect contributor stats"""
+    repos = _repos_with_commits(repos)
     logger.info(f"Collecting contributor stats for {len(repos)} repositories")
-    for repo in repos:
-        name = repo["name"]
-        contributor_data = {}
-
-        # Get commit stats
-        stats_url = f"https://api.github.com/repos/{organization}/{name}/stats/contributors"
-        try:
-            stats = get_paginated_data(stats_url, headers)
-            if not isinstance(stats, list):
-                continue
-        except requests.RequestException as e:
-            logger.warning(f"Failed to get contributor stats for {name}: {e}")
+    repo_names = [repo["name"] for repo in repos]
+    for name, stats in zip(
+        repo_names, map_concurrently(partial(_fetch_contributor_stats, organization, headers), repo_names)
+    ):
+        if stats is None:
             continue
-
-        # Process commit stats
+        # Each contributor appears once with one entry per week, so rows can be yielded as they are built
         for contributor in stats:
             author = contributor["author"]["login"]
             avatar_url = contributor["author"]["avatar_url"]
 
             for week in contributor["weeks"]:
-                week_date = datetime.fromtimestamp(week["w"], tz=timezone.utc).strftime("%Y-%m-%d")
-                key = (author, week_date)
+                yield {
+                    "pipeline_name": name,
+                    "author": author,
+                    "avatar_url": avatar_url,
+                    "week_date": _week_date(week["w"]),
+                    "week_additions": week["a"],
+                    "week_deletions": week["d"],
+                    "week_commits": week["c"],
+                    "week_approvals": 0,
+                }
+
+
+def _week_start_timestamp(timestamp: str) -> int:
+    """Unix timestamp of the same time of day on the Monday of the week of a GitHub timestamp
 
-                if key not in contributor_data:
-                    contributor_data[key] = {
-                        "pipeline_name": name,
-                        "author": author,
-                        "avatar_url": avatar_url,
-                        "week_date": week_date,
-                        "week_additions": week["a"],
-                        "week_deletions": week["d"],
-                        "week_commits": week["c"],
-                        "week_approvals": 0,
-                    }
+    Works on integer seconds instead of datetime objects: the Unix epoch started on a Thursday,
+    so `(days + 3) % 7` is the weekday (Monday = 0) of a timestamp `days` days after the epoch.
+    """
+    seconds = calendar.timegm(
+        (
+            int(timestamp[0:4]),
+            int(timestamp[5:7]),
+            int(timestamp[8:10]),
+            int(timestamp[11:13]),
+            int(timestamp[14:16]),
+            int(timestamp[17:19]),
+        )
+    )
+    return seconds - ((seconds // 86400 + 3) % 7) * 86400
+
+
+@cache
+def _week_date(week_timestamp: int) -> str:
+    """Format the Unix timestamp of a week as date; the same weeks recur for every contributor"""
+    return datetime.fromtimestamp(week_timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _rest_login(author: dict | None) -> str:
+    """Convert a GraphQL author to the login the REST API reports (bots carry a `[bot]` suffix there)"""
+    if author is None:
+        return DELETED_USER_LOGIN
+    return f"{author['login']}[bot]" if author["__typename"] == "Bot" else author["login"]
+
+
+def _first_response_from_rest(organization: str, name: str, issue: dict, headers: dict) -> tuple[str, str] | None:
+    """Walk the comments of an issue and return (login, created_at) of the first one not by the author
+
+    Comments are returned oldest first. Pages are requested one at a time and the walk stops at the
+    first match, so usually only the first page is downloaded.
+    """
+    comments_url = f"https://api.github.com/repos/{organization}/{name}/issues/{issue['number']}/comments?per_page=100"
+    while comments_url:
+        response = github_request(comments_url, headers)
+        for comment in json.loadb(response.content):
+            login = (comment.get("user") or {}).get("login") or DELETED_USER_LOGIN
+            if login != issue["user"]["login"]:
+                return login, comment["created_at"]
+        comments_url = response.links.get("next", {}).get("url")
+    return None
+
+
+def _get_first_responses(organization: str, name: str, issues: list[dict], headers: dict) -> dict[int, tuple[str, str]]:
+    """Find the first comment not written by the author for a batch of issues
+
+    The first comments of all issues are fetched with a single GraphQL query instead of one
+    REST request per issue. Only issues whose first comments are all by the author fall back
+    to walking the full comment list.
+
+    Returns:
+        Mapping from issue number to (login, created_at) of the first responder
+    """
+    comment_fields = (
+        f"comments(first: {FIRST_COMMENTS_PER_ISSUE}) "
+        "{ totalCount nodes { createdAt author { __typename login } } }"
+    )
+    aliases = " ".join(
+        f"i{issue['number']}: issueOrPullRequest(number: {issue['number']}) "
+        f"{{ ... on Issue {{ {comment_fields} }} ... on PullRequest {{ {comment_fields} }} }}"
+        for issue in issues
+    )
+    query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+    repository = graphql_request(query, {"owner": organization, "name": name}, headers).get("repository") or {}
+
+    first_responses = {}
+    for issue in issues:
+        comments = (repository.get(f"i{issue['number']}") or {}).get("comments")
+        if not comments:
+            continue
+
+        for comment in comments["nodes"]:
+            login = _rest_login(comment["author"])
+            if login != issue["user"]["login"]:
+                first_responses[issue["number"]] = (login, comment["createdAt"])
+                break
+        else:
+            if comments["totalCount"] > len(comments["nodes"]):
+                first_response = _first_response_from_rest(organization, name, issue, headers)
+                if first_response:
+                    first_responses[issue["number"]] = first_response
 
-        yield from contributor_data.values()
+    return first_responses
+
+
+def _issue_rows(
+    organization: str, name: str, issues: list[dict], headers: dict, repo_processed: dict, fetch_comments: bool
+) -> Generator[dict, None, bool]:
+    """Build the issue_stats rows for a batch of issues of one repository and update the state
+
+    Returns:
+        False if the first responses of some issues were not looked up, either for lack of rate
+        limit or because the lookup failed
+    """
+
+    def needs_first_response(issue: dict) -> bool:
+        # Only look up the first response if:
+        # 1. Issue has comments
+        # 2. Either new issue OR comment count has changed
+        issue_key = str(issue["number"])
+        previous_comment_count = repo_processed.get(issue_key, {}).get("num_comments", 0)
+        return issue["comments"] > 0 and (
+            issue_key not in repo_processed or issue["comments"] != previous_comment_count
+        )
+
+    first_responses = {}
+    issues_to_fetch = [issue for issue in issues if needs_first_response(issue)]
+    # Only fetch comments if we have rate limit headroom
+    looked_up = fetch_comments
+    if issues_to_fetch and fetch_comments:
+        try:
+            first_responses = _get_first_responses(organization, name, issues_to_fetch, headers)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to get comments for {len(issues_to_fetch)} issues in {name}: {e}")
+            # Don't fail the whole pipeline, just skip these issues' comments
+            looked_up = False
+    not_looked_up = set() if looked_up else {issue["number"] for issue in issues_to_fetch}
+
+    for issue in issues:
+        is_pr = "pull_request" in issue
+        created_at = _parse_github_timestamp(issue["created_at"])
+        issue_key = str(issue["number"])  # Calculate close time
+        closed_wait = None
+        if issue["closed_at"]:
+            closed_at = _parse_github_timestamp(issue["closed_at"])
+            closed_wait = (closed_at - created_at).total_seconds()
+
+        previous_data = repo_processed.get(issue_key, {})
+        first_response_time = previous_data.get("first_response_seconds")
+        first_responder = previous_data.get("first_responder")
+
+        if issue["number"] in first_responses:
+            first_responder, responded_at = first_responses[issue["number"]]
+            comment_time = _parse_github_timestamp(responded_at)
+            first_response_time = (comment_time - created_at).total_seconds()
+
+        # Store this issue in our state. Issues whose comments were not looked up keep their previous
+        # comment count, so the lookup is still made when they are listed again.
+        repo_processed[issue_key] = {
+            "num_comments": previous_data.get("num_comments", 0)
+            if issue["number"] in not_looked_up
+            else issue["comments"],
+            "first_response_seconds": first_response_time,
+            "first_responder": first_responder,
+        }
+
+        yield {
+            "pipeline_name": name,
+            "issue_number": issue["number"],
+            "issue_type": "pr" if is_pr else "issue",
+            "state": issue["state"],
+            "created_by": issue["user"]["login"],
+            "created_at": issue["created_at"],
+            "updated_at": issue["updated_at"],
+            "closed_at": issue["closed_at"],
+            "closed_wait_seconds": closed_wait,
+            "first_response_seconds": first_response_time,
+            "first_responder": first_responder,
+            "num_comments": issue["comments"],
+            "html_url": issue["html_url"],
+        }
+
+    return not not_looked_up
+
+
+def _iter_issue_rows(
+    organization: str, headers: dict, fetch_comments: bool, job: tuple[str, str, dict]
+) -> Generator[dict, None, tuple[dict, bool] | None]:
+    """Yield the issue_stats rows of one repository page by page
+
+    Works on a copy of the processed issues state of the repository and returns the updated copy
+    together with whether the first responses of all its issues were looked up, or None if the
+    issues could not be fetched. Rows yielded before such a failure are still valid, but as the
+    state is not updated, they are fetched again on the next run.
+    """
+    name, issues_url, repo_processed = job
+    complete = True
+    try:
+        for batch in batched(iter_paginated_data(issues_url, headers), FIRST_RESPONSE_BATCH_SIZE):
+            rows = _issue_rows(organization, name, batch, headers, repo_processed, fetch_comments)
+            complete = (yield from rows) and complete
+    except requests.RequestException as e:
+        logger.warning(f"Failed to get issues for {name}: {e}")
+        return None
+    return repo_processed, complete
 
 
 @dlt.resource(write_disposition="merge", primary_key=["pipeline_name", "issue_number"])
 def issue_stats(organization: str, headers: dict, repos: list[dict]) -> Iterator[dict]:
-    """Collect issue and PR stats with incremental comment loading"""
+    """Collect issue and PR stats with incremental issue and comment loading"""
     logger.info(f"Collecting issue and PR stats for {len(repos)} repositories")
 
     # Get current state to check which issues we've already processed
     state = dlt.current.source_state()
     processed_issues = state.setdefault("processed_issues", {})
+    # Archived repos are read-only, so their issues only need to be collected once after archiving
+    archived_repos_done = state.setdefault("archived_issue_repos", [])
+    last_issue_check = state.setdefault("last_issue_check", {})
+    check_started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     # Check rate limit before expensive comment fetching
     rate_status = check_rate_limit(headers, min_remaining=500)
@@ -220,90 +478,41 @@ def issue_stats(organization: str, headers: dict, repos: list[dict]) -> Iterator
             "Will fetch comments on next run."
         )
 
+    repos_to_fetch = []
+    jobs = []
     for repo in repos:
         name = repo["name"]
-        issues_url = f"https://api.github.com/repos/{organization}/{name}/issues?state=all"
-
-        try:
-            issues = get_paginated_data(issues_url, headers)
-            if not isinstance(issues, list):
+        if name in archived_repos_done:
+            if repo["archived"]:
+                logger.debug(f"Skipping issues of archived repository {name}")
                 continue
-        except requests.RequestException as e:
-            logger.warning(f"Failed to get issues for {name}: {e}")
-            continue
+            archived_repos_done.remove(name)  # Unarchived again
 
-        repo_processed = processed_issues.setdefault(name, {})
-
-        for issue in issues:
-            is_pr = "pull_request" in issue
-            created_at = datetime.strptime(issue["created_at"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-            issue_key = str(issue["number"])  # Calculate close time
-            closed_wait = None
-            if issue["closed_at"]:
-                closed_at = datetime.strptime(issue["closed_at"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-                closed_wait = (closed_at - created_at).total_seconds()
-
-            # Check if we need to fetch comments for this issue
-            previous_data = repo_processed.get(issue_key, {})
-            previous_comment_count = previous_data.get("num_comments", 0)
-            current_comment_count = issue["comments"]
-
-            # Only fetch comments if:
-            # 1. We have rate limit headroom
-            # 2. Issue has comments
-            # 3. Either new issue OR comment count has changed
-            should_fetch_comments = (
-                fetch_comments
-                and current_comment_count > 0
-                and (issue_key not in repo_processed or current_comment_count != previous_comment_count)
-            )
-
-            first_response_time = previous_data.get("first_response_seconds")
-            first_responder = previous_data.get("first_responder")
-
-            if should_fetch_comments:
-                comments_url = f"https://api.github.com/repos/{organization}/{name}/issues/{issue['number']}/comments"
-                try:
-                    comments = get_paginated_data(comments_url, headers)
-                    if isinstance(comments, list):
-                        for comment in comments:
-                            if (
-                                comment.get("user", {}).get("login")
-                                and comment["user"]["login"] != issue["user"]["login"]
-                            ):
-                                comment_time = datetime.strptime(comment["created_at"], "%Y-%m-%dT%H:%M:%SZ").replace(
-                                    tzinfo=timezone.utc
-                                )
-                                first_response_time = (comment_time - created_at).total_seconds()
-                                first_responder = comment["user"]["login"]
-                                break
-                except requests.RequestException as e:
-                    logger.warning(f"Failed to get comments for issue {issue['number']} in {name}: {e}")
-                    # Don't fail the whole pipeline, just skip this issue's comments
-                    pass
-
-            # Store this issue in our state
-            repo_processed[issue_key] = {
-                "num_comments": current_comment_count,
-                "first_response_seconds": first_response_time,
-                "first_responder": first_responder,
-            }
+        # Only list issues updated since the last check; unchanged rows are already in the destination
+        issues_url = f"https://api.github.com/repos/{organization}/{name}/issues?state=all"
+        if name in last_issue_check:
+            issues_url += f"&since={last_issue_check[name]}"
+        repos_to_fetch.append(repo)
+        jobs.append((name, issues_url, dict(processed_issues.get(name, {}))))
+
+    # Fetch the issues of all repos concurrently
+    # Rows are passed on as the workers produce them, so no repository's rows are collected first
+    fetched = stream_concurrently(partial(_iter_issue_rows, organization, headers, fetch_comments), jobs)
+    for index, finished, value in fetched:
+        if not finished:
+            yield value
+            continue
+        repo = repos_to_fetch[index]
+        if value is None:
+            continue
+        repo_processed, comments_complete = value
+        processed_issues[repo["name"]] = repo_processed
 
-            yield {
-                "pipeline_name": name,
-                "issue_number": issue["number"],
-                "issue_type": "pr" if is_pr else "issue",
-                "state": issue["state"],
-                "created_by": issue["user"]["login"],
-                "created_at": issue["created_at"],
-                "updated_at": issue["updated_at"],
-                "closed_at": issue["closed_at"],
-                "closed_wait_seconds": closed_wait,
-                "first_response_seconds": first_response_time,
-                "first_responder": first_responder,
-                "num_comments": issue["comments"],
-                "html_url": issue["html_url"],
-            }
+        # Issues whose first responses were not looked up must be listed again on a later run
+        if comments_complete:
+            last_issue_check[repo["name"]] = check_started_at
+            if repo["archived"]:
+                archived_repos_done.append(repo["name"])
 
 
 @dlt.resource(write_disposition="merge", primary_key=["timestamp"])
@@ -312,9 +521,35 @@ def org_members(organization: str, headers: dict) -> Iterator[dict]:
     logger.info(f"Collecting organization member count for {organization}")
     members_url = f"https://api.github.com/orgs/{organization}/members"
 
-    members = get_paginated_data(members_url, headers)
-    logger.info(f"Found {len(members)} members in {organization}")
-    yield {"timestamp": datetime.now(timezone.utc).timestamp(), "num_members": len(members)}
+    num_members = sum(1 for _ in iter_paginated_data(members_url, headers))
+    logger.info(f"Found {num_members} members in {organization}")
+    yield {"timestamp": datetime.now(timezone.utc).timestamp(), "num_members": num_members}
+
+
+def _get_release_summaries(organization: str, names: list[str], headers: dict) -> dict[str, tuple[int, str | None]]:
+    """Look up the number of releases and the latest release date of several repos in one GraphQL query
+
+    Returns:
+        Mapping from repo name to (number of releases, publication date of the latest release)
+    """
+    releases = "releases(first: 1, orderBy: {field: CREATED_AT, direction: DESC}) { totalCount nodes { publishedAt } }"
+    aliases = " ".join(
+        f'r{i}: repository(owner: $owner, name: "{name}") {{ {releases} }}' for i, name in enumerate(names)
+    )
+    data = graphql_request(f"query($owner: String!) {{ {aliases} }}", {"owner": organization}, headers)
+
+    summaries = {}
+    for i, name in enumerate(names):
+        repository = data.get(f"r{i}")
+        if not repository:
+            logger.warning(f"Failed to get releases for {name}")
+            continue
+        number_of_releases = repository["releases"]["totalCount"]
+        if not number_of_releases:
+            logger.info(f"No releases found for {name} (this is expected for new repositories)")
+        nodes = repository["releases"]["nodes"]
+        summaries[name] = (number_of_releases, nodes[0]["publishedAt"] if nodes else None)
+    return summaries
 
 
 @dlt.resource(write_disposition="merge", primary_key=["name"], name="nfcore_pipelines")
@@ -329,28 +564,60 @@ def pipelines(organization: str, headers: dict, repos: list[dict]) -> Iterator[d
         logger.warning(f"Failed to get pipeline names from nf-core website: {e}")
         return
 
+    repos_by_name = {repo["name"]: repo for repo in repos}
+    pipeline_set = set(pipeline_names.get("pipeline", []))
+
+    pipeline_repos = []
     for pipeline_name in pipeline_names.get("pipeline", []):
-        pipeline = next((repo for repo in repos if repo["name"] == pipeline_name), None)
+        pipeline = repos_by_name.get(pipeline_name)
         if not pipeline:
             logger.warning(f"{pipeline_name} is not a pipeline")
             continue
+        pipeline_repos.append(pipeline)
 
-        # Get latest release
-        release_url = f"https://api.github.com/repos/{organization}/{pipeline_name}/releases"
+    # Publishing a release usually pushes its tag, so the releases of repos without new pushes are
+    # mostly unchanged. Releases can also be deleted or published from an existing tag without a push,
+    # so summaries are only reused for RELEASE_SUMMARY_MAX_AGE.
+    state = dlt.current.source_state()
+    last_release_summary = state.setdefault("last_release_summary", {})
+    now = datetime.now(timezone.utc)
+    release_summaries = {}
+    stale_pipelines = []
+    for pipeline in pipeline_repos:
+        previous = last_release_summary.get(pipeline["name"])
+        if (
+            previous
+            and previous["pushed_at"] == pipeline["pushed_at"]
+            and "checked_at" in previous
+            and now - datetime.fromisoformat(previous["checked_at"]) < RELEASE_SUMMARY_MAX_AGE
+        ):
+            release_summaries[pipeline["name"]] = (previous["number_of_releases"], previous["last_release_date"])
+        else:
+            stale_pipelines.append(pipeline)
+    logger.info(
+        f"Fetching releases for {len(stale_pipelines)}/{len(pipeline_repos)} pipelines with new pushes or old summaries"
+    )
+
+    # Fetch the releases of many pipelines per GraphQL query instead of paginating /releases of each
+    fetched = {}
+    for batch in batched([pipeline["name"] for pipeline in stale_pipelines], RELEASE_SUMMARY_BATCH_SIZE):
         try:
-            releases = get_paginated_data(release_url, headers)
-            number_of_releases = len(releases)
-            if number_of_releases:
-                # releases are sorted by date, starting with the most recent one
-                last_release_date = releases[0].get("published_at")
-            else:
-                logger.info(f"No releases found for {pipeline_name} (this is expected for new repositories)")
-                last_release_date = None
+            fetched.update(_get_release_summaries(organization, batch, headers))
         except requests.RequestException as e:
-            logger.warning(f"Failed to get latest release for {pipeline_name}: {e}")
-            last_release_date = None
-            number_of_releases = None
+            logger.warning(f"Failed to get releases for {len(batch)} pipelines: {e}")
+    for pipeline in stale_pipelines:
+        number_of_releases, last_release_date = fetched.get(pipeline["name"], (None, None))
+        release_summaries[pipeline["name"]] = (number_of_releases, last_release_date)
+        if number_of_releases is not None:
+            last_release_summary[pipeline["name"]] = {
+                "pushed_at": pipeline["pushed_at"],
+                "number_of_releases": number_of_releases,
+                "last_release_date": last_release_date,
+                "checked_at": now.isoformat(),
+            }
 
+    for pipeline in pipeline_repos:
+        number_of_releases, last_release_date = release_summaries[pipeline["name"]]
         yield {
             "name": pipeline["name"],
             "description": pipeline["description"] or "",
@@ -371,7 +638,7 @@ def pipelines(organization: str, headers: dict, repos: list[dict]) -> Iterator[d
 
     # add all repos that are not pipelines to core_repos
     for repo in repos:
-        if repo["name"] not in pipeline_names.get("pipeline", []):
+        if repo["name"] not in pipeline_set:
             logger.info(f"Adding {repo['name']} to core_repos")
             yield {
                 "name": repo["name"],
@@ -390,6 +657,39 @@ def pipelines(organization: str, headers: dict, repos: list[dict]) -> Iterator[d
             }
 
 
+def _fetch_commit_counts(
+    organization: str, headers: dict, repo: tuple[str, str | None]
+) -> tuple[Counter[int], str] | None:
+    """Count the commits of a repo since the last check per week
+
+    Returns:
+        The number of commits per week start timestamp and the new check time,
+        or None if the commits could not be fetched
+    """
+    name, since_date = repo
+
+    # Build URL - only use 'since' parameter if we have a previous state
+    if since_date:
+        commits_url = f"https://api.github.com/repos/{organization}/{name}/commits?since={since_date}&per_page=100"
+        logger.debug(f"Fetching commits for {name} since {since_date} (incremental)")
+    else:
+        commits_url = f"https://api.github.com/repos/{organization}/{name}/commits?per_page=100"
+        logger.info(f"Fetching all commits for {name} (first run)")
+
+    # Count the commits per week while streaming pages, so neither the commits nor their dates are held in memory
+    commit_counts = Counter()
+    try:
+        for commit in iter_paginated_data(commits_url, headers):
+            if commit_date := commit.get("commit", {}).get("author", {}).get("date"):
+                commit_counts[_week_start_timestamp(commit_date)] += 1
+    except requests.RequestException as e:
+        logger.warning(f"Failed to get commits for {name}: {e}")
+        return None
+
+    # Update last check time for this repo to now
+    return commit_counts, datetime.now(timezone.utc).isoformat()
+
+
 @dlt.resource(write_disposition="merge", primary_key=["pipeline_name", "timestamp"])
 def commit_stats(organization: str, headers: dict, repos: list[dict]) -> Iterator[dict]:
     """Collect commit statistics over time with incremental loading"""
@@ -397,52 +697,36 @@ def commit_stats(organization: str, headers: dict, repos: list[dict]) -> Iterato
     state = dlt.current.source_state()
     last_commit_check = state.setdefault("last_commit_check", {})
 
+    repos = _repos_with_commits(repos)
     logger.info(f"Collecting commit statistics for {len(repos)} repositories (incremental mode)")
 
+    repos_to_check = []
     for repo in repos:
         name = repo["name"]
 
         # Check if we have a last check time for this repo
         since_date = last_commit_check.get(name)
 
-        # Build URL - only use 'since' parameter if we have a previous state
-        if since_date:
-            commits_url = f"https://api.github.com/repos/{organization}/{name}/commits?since={since_date}&per_page=100"
-            logger.debug(f"Fetching commits for {name} since {since_date} (incremental)")
-        else:
-            commits_url = f"https://api.github.com/repos/{organization}/{name}/commits?per_page=100"
-            logger.info(f"Fetching all commits for {name} (first run)")
-
-        try:
-            commits = get_paginated_data(commits_url, headers)
-            if not isinstance(commits, list):
+        # Nothing was pushed since the last check (e.g. archived repos), so there are no new commits
+        if since_date and repo.get("pushed_at"):
+            if _parse_github_timestamp(repo["pushed_at"]) < datetime.fromisoformat(since_date):
+                logger.debug(f"No pushes to {name} since {since_date}, skipping")
                 continue
+        repos_to_check.append((name, since_date))
 
-            # Update last check time for this repo to now
-            last_commit_check[name] = datetime.now(timezone.utc).isoformat()
-
-        except requests.RequestException as e:
-            logger.warning(f"Failed to get commits for {name}: {e}")
+    # Fetch the commits of all repos concurrently; the state is only updated here, in the resource itself
+    fetched = map_concurrently(partial(_fetch_commit_counts, organization, headers), repos_to_check)
+    for (name, _), result in zip(repos_to_check, fetched):
+        if result is None:
             continue
+        commit_counts, checked_at = result
+        last_commit_check[name] = checked_at
 
-        if not commits:
+        if not commit_counts:
             logger.debug(f"No new commits for {name}")
             continue
 
-        logger.info(f"Found {len(commits)} commits for {name}")
-
-        # Group commits by week
-        commit_counts: dict[int, int] = {}
-        for commit in commits:
-            commit_date = commit.get("commit", {}).get("author", {}).get("date")
-            if not commit_date:
-                continue
-
-            commit_time = datetime.strptime(commit_date, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-            week_start = commit_time - timedelta(days=commit_time.weekday())
-            week_timestamp = int(week_start.timestamp())
-
-            commit_counts[week_timestamp] = commit_counts.get(week_timestamp, 0) + 1
+        logger.info(f"Found {commit_counts.total()} commits for {name}")
 
         # Yield all data for this repo
         for timestamp, commit_count in commit_counts.items():
@@ -15,12 +15,18 @@ Token Requirements:
 """
 
 from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
 import dlt
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+    ServerErrorRetryHandler,
+)
 
 from ._logging import log_pipeline_stats, logger
 
@@ -28,9 +34,9 @@ from ._logging import log_pipeline_stats, logger
 SLACK_API_LIMIT = 1000
 
 
-def paginate_slack_api(api_call: Callable, data_key: str, description: str, **kwargs) -> list[Any]:
+def iter_slack_api(api_call: Callable, data_key: str, description: str, **kwargs) -> Iterator[list[Any]]:
     """
-    Generic pagination handler for Slack API calls
+    Generic pagination handler for Slack API calls, yielding one page of results at a time
 
     Args:
         api_call: The Slack API method to call
@@ -38,10 +44,10 @@ def paginate_slack_api(api_call: Callable, data_key: str, description: str, **kw
         description: Description for logging (e.g., 'users', 'channels')
         **kwargs: Additional arguments to pass to the API call
 
-    Returns:
-        List of all paginated results
+    Yields:
+        The results of each page
     """
-    all_results = []
+    total = 0
     cursor = None
 
     while True:
@@ -54,31 +60,31 @@ def paginate_slack_api(api_call: Callable, data_key: str, description: str, **kw
                 logger.error(f"Failed to get {description}: {response.get('error', 'Unknown error')}")
                 break
             batch_data = response.get(data_key, [])
-            all_results.extend(batch_data)
+            total += len(batch_data)
 
             # Check if there are more pages
             response_metadata = response.get("response_metadata", {})
             cursor = response_metadata.get("next_cursor")
 
-            logger.info(f"Retrieved {len(batch_data)} {description} in this batch (total so far: {len(all_results)})")
-
-            if not cursor:
-                break
+            logger.info(f"Retrieved {len(batch_data)} {description} in this batch (total so far: {total})")
 
         except SlackApiError as e:
             logger.error(f"Slack API error getting {description}: {e}")
             break
 
-    return all_results
+        yield batch_data
+        if not cursor:
+            break
 
 
-def get_active_users_from_billing_info(client: WebClient, valid_user_ids: set[str]) -> set[str]:
-    """Get active users using team.billableInfo API"""
+def get_active_users_from_billing_info(client: WebClient) -> set[str]:
+    """Get the IDs of all billing-active users using team.billableInfo API"""
     logger.info("Using team.billableInfo API to determine active users")
 
     try:
-        # Get all billing info with pagination
-        all_billing_info = {}
+        # Page through the billing info, keeping only the IDs of active users from each page
+        active_users = set()
+        total_users = 0
         cursor = None
 
         while True:
@@ -88,23 +94,19 @@ def get_active_users_from_billing_info(client: WebClient, valid_user_ids: set[st
                 raise ValueError(f"Failed to get billable info: {response.get('error', 'Unknown error')}")
 
             billing_info_batch: dict[str, Any] = response.get("billable_info", {})
-            all_billing_info.update(billing_info_batch)
+            total_users += len(billing_info_batch)
+            active_users.update(
+                user_id
+                for user_id, billing_info in billing_info_batch.items()
+                if billing_info.get("billing_active", False)
+            )
 
             response_metadata: dict[str, Any] = response.get("response_metadata", {})
             cursor = response_metadata.get("next_cursor")
             if not cursor:
                 break
 
-        logger.info(f"Retrieved billing info for {len(all_billing_info)} users")
-
-        # Find active users
-        active_users = {
-            user_id
-            for user_id, billing_info in all_billing_info.items()
-            if billing_info.get("billing_active", False) and user_id in valid_user_ids
-        }
-
-        logger.info(f"Found {len(active_users)} billing-active users")
+        logger.info(f"Retrieved billing info for {total_users} users")
         return active_users
 
     except SlackApiError as e:
@@ -117,15 +119,19 @@ def get_active_users_from_billing_info(client: WebClient, valid_user_ids: set[st
         raise
 
 
-def create_user_detail(user: dict[str, Any], active_user_ids: set[str]) -> dict[str, Any]:
-    """Create user detail dictionary from user data"""
+def create_user_detail(user: dict[str, Any]) -> dict[str, Any]:
+    """Create user detail dictionary from user data
+
+    `is_active` is only known once the billing info is available, so it starts out as False.
+    """
+    profile = user.get("profile") or {}
     return {
         "id": user["id"],
         "name": user.get("real_name_normalized", user["name"]),
-        "email": user.get("profile", {}).get("email"),
+        "email": profile.get("email"),
         "is_admin": user.get("is_admin", False),
         "is_bot": user.get("is_bot", False),
-        "is_active": user["id"] in active_user_ids,
+        "is_active": False,
     }
 
 
@@ -135,7 +141,16 @@ def slack_source(api_token: str = dlt.secrets.value) -> list[Any]:
     # Add debug logging
     logger.info(f"Initializing Slack client with token starting with: {api_token[:5]}...")
 
-    client = WebClient(token=api_token)
+    # Retry rate limited (429, honouring Retry-After), failed (5xx) and dropped requests
+    # instead of failing the whole run on a transient error
+    client = WebClient(
+        token=api_token,
+        retry_handlers=[
+            ConnectionErrorRetryHandler(max_retry_count=3),
+            RateLimitErrorRetryHandler(max_retry_count=5),
+            ServerErrorRetryHandler(max_retry_count=3),
+        ],
+    )
 
     try:
         # Test the connection
@@ -152,30 +167,37 @@ def slack_source(api_token: str = dlt.secrets.value) -> list[Any]:
 def slack_stats_resource(client: WebClient) -> Iterator[dict[str, Any]]:
     """Collect combined Slack statistics in a single table"""
     try:
-        # Get all users (excluding deleted ones)
-        all_members = paginate_slack_api(client.users_list, "members", "users")
-        if not all_members:
-            return
+        # The user list and the billing info are independent, so page through both at the same time
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            billing_active_future = executor.submit(get_active_users_from_billing_info, client)
+
+            # Get all users (excluding deleted ones) in a single pass over the pages,
+            # keeping only the fields we store instead of the full user objects
+            user_details = []
+            for batch in iter_slack_api(client.users_list, "members", "users"):
+                user_details.extend(create_user_detail(user) for user in batch if not user.get("deleted", False))
+            if not user_details:
+                return
 
-        active_account_users = [user for user in all_members if not user.get("deleted", False)]
-        valid_user_ids = {user["id"] for user in active_account_users}
+            logger.info(f"Total users: {len(user_details)}")
 
-        logger.info(f"Total users: {len(active_account_users)}")
+            # Get billing-active users
+            billing_active_ids = billing_active_future.result()
 
-        # Get billing-active users
-        active_user_ids = get_active_users_from_billing_info(client, valid_user_ids)
-        active_users = len(active_user_ids)
-        inactive_users = len(active_account_users) - active_users
+        for user_detail in user_details:
+            user_detail["is_active"] = user_detail["id"] in billing_active_ids
+        active_users = sum(user_detail["is_active"] for user_detail in user_details)
+        inactive_users = len(user_details) - active_users
 
         logger.info(f"Active users: {active_users}, Inactive users: {inactive_users}")
 
         # Yield stats
         yield {
             "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-            "total_users": len(active_account_users),
+            "total_users": len(user_details),
             "active_users": active_users,
             "inactive_users": inactive_users,
-            "user_details": [create_user_detail(user, active_user_ids) for user in active_account_users],
+            "user_details": user_details,
         }
 
     except Exception as e:
@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# Importing nf_core_stats reads the GitHub token and the ETag cache location from the dlt config,
+# so point both at dummy values before any test module imports it
+os.environ.setdefault("SOURCES__GITHUB_PIPELINE__GITHUB__API_TOKEN", "test-token")
+os.environ.setdefault(
+    "SOURCES__GITHUB_PIPELINE__ETAG_CACHE_PATH", os.path.join(tempfile.mkdtemp(), "github_etags.sqlite")
+)
@@ -0,0 +1,12 @@
+from nf_core_stats.citations_pipeline import _parse_doi_from_nextflow_config
+
+
+def test_parse_doi_skips_block_comments_in_manifest():
+    config = """
+manifest {
+    name = 'nf-core/example'
+    /* don't change the DOI without updating CITATIONS.md { */
+    doi = 'https://doi.org/10.5281/zenodo.1400710'
+}
+"""
+    assert _parse_doi_from_nextflow_config(config) == "10.5281/zenodo.1400710"
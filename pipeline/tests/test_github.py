@@ -0,0 +1,114 @@
+import threading
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+from dlt.common import json
+
+from nf_core_stats import _github
+from nf_core_stats._github import iter_paginated_data, stream_concurrently
+
+URL = "https://api.github.com/repos/nf-core/rnaseq/issues?state=all"
+
+
+def _page_response(url: str, data: list, links: dict[str, int]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = json.dumpb(data)
+    response.headers["Link"] = ", ".join(
+        f'<{_github._page_url(url, page)}>; rel="{rel}"' for rel, page in links.items()
+    )
+    return response
+
+
+@pytest.fixture
+def paginated_endpoint(monkeypatch):
+    """Serve `pages` pages of three items each and record the requested page numbers"""
+    requested = []
+    lock = threading.Lock()
+
+    def serve(pages: int, with_last: bool = True):
+        def fake_github_request(url: str, headers: dict) -> requests.Response:
+            page = int(dict(parse_qsl(urlsplit(url).query)).get("page", 1))
+            with lock:
+                requested.append(page)
+            links = {}
+            if page < pages:
+                links["next"] = page + 1
+                if with_last:
+                    links["last"] = pages
+            return _page_response(url, [page * 10 + i for i in range(3)], links)
+
+        monkeypatch.setattr(_github, "github_request", fake_github_request)
+        return requested
+
+    return serve
+
+
+def test_iter_paginated_data_fetches_pages_after_the_first_concurrently(paginated_endpoint):
+    requested = paginated_endpoint(pages=_github.MAX_CONCURRENT_REQUESTS + 3)
+
+    items = list(iter_paginated_data(URL, {}))
+
+    pages = range(1, _github.MAX_CONCURRENT_REQUESTS + 4)
+    assert items == [page * 10 + i for page in pages for i in range(3)]
+    assert requested[0] == 1
+    assert sorted(requested) == list(pages)
+
+
+def test_iter_paginated_data_requests_the_maximum_page_size(monkeypatch):
+    urls = []
+
+    def fake_github_request(url: str, headers: dict) -> requests.Response:
+        urls.append(url)
+        return _page_response(url, [], {})
+
+    monkeypatch.setattr(_github, "github_request", fake_github_request)
+
+    assert list(iter_paginated_data(URL, {})) == []
+    assert dict(parse_qsl(urlsplit(urls[0]).query)) == {"state": "all", "per_page": "100"}
+
+
+def test_iter_paginated_data_follows_next_links_without_last_link(paginated_endpoint):
+    requested = paginated_endpoint(pages=3, with_last=False)
+
+    assert list(iter_paginated_data(URL, {})) == [10, 11, 12, 20, 21, 22, 30, 31, 32]
+    assert requested == [1, 2, 3]
+
+
+def test_stream_concurrently_yields_values_and_results():
+    def count_up(n: int):
+        yield from range(n)
+        return n * 10
+
+    streamed = list(stream_concurrently(count_up, [2, 0, 3]))
+
+    for index, n in enumerate([2, 0, 3]):
+        entries = [(finished, value) for i, finished, value in streamed if i == index]
+        assert entries == [*((False, i) for i in range(n)), (True, n * 10)]
+
+
+def test_stream_concurrently_bounds_the_buffer():
+    produced = []
+
+    def produce(n: int):
+        for i in range(n):
+            produced.append(i)
+            yield i
+
+    stream = stream_concurrently(produce, [100], max_buffered=5)
+    assert next(stream) == (0, False, 0)
+    # The worker can only run ahead by the size of the buffer (plus the value it is waiting to put)
+    threading.Event().wait(0.2)
+    assert len(produced) <= 7
+    assert [value for _, finished, value in stream if not finished] == list(range(1, 100))
+
+
+def test_stream_concurrently_raises_worker_errors():
+    def fail(item: int):
+        yield item
+        raise requests.HTTPError("boom")
+
+    with pytest.raises(requests.HTTPError, match="boom"):
+        list(stream_concurrently(fail, [1]))
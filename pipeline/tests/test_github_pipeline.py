@@ -0,0 +1,105 @@
+import dlt
+import pytest
+
+from nf_core_stats import github_pipeline
+
+
+def _issue(number: int, comments: int) -> dict:
+    return {
+        "number": number,
+        "comments": comments,
+        "state": "open",
+        "user": {"login": "author"},
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+        "closed_at": None,
+        "html_url": f"https://github.com/nf-core/rnaseq/issues/{number}",
+    }
+
+
+@pytest.fixture
+def github_stub(monkeypatch):
+    """Serve the issues of every repo from `issues` and record the first-response lookups"""
+    stub = {"remaining": 5000, "issues": {}, "lookup_fails": False, "lookups": [], "urls": []}
+
+    def fake_iter_paginated_data(url: str, headers: dict):
+        stub["urls"].append(url)
+        yield from stub["issues"][url.split("/")[5]]
+
+    def fake_get_first_responses(organization: str, name: str, issues: list[dict], headers: dict) -> dict:
+        stub["lookups"].append([issue["number"] for issue in issues])
+        if stub["lookup_fails"]:
+            raise github_pipeline.requests.HTTPError("GraphQL query failed")
+        return {issue["number"]: ("responder", "2024-01-01T01:00:00Z") for issue in issues}
+
+    monkeypatch.setattr(github_pipeline, "check_rate_limit", lambda headers, min_remaining: stub)
+    monkeypatch.setattr(github_pipeline, "iter_paginated_data", fake_iter_paginated_data)
+    monkeypatch.setattr(github_pipeline, "_get_first_responses", fake_get_first_responses)
+    return stub
+
+
+@pytest.fixture
+def extract_issues(tmp_path):
+    """Extract issue_stats for `repos` and return the rows and the source state"""
+    pipeline = dlt.pipeline("test_issue_stats", pipelines_dir=str(tmp_path), destination="duckdb")
+
+    @dlt.source(name="github")
+    def source(repos: list[dict], rows: list[dict]):
+        return github_pipeline.issue_stats("nf-core", {}, repos).add_map(lambda row: rows.append(row) or row)
+
+    def extract(repos: list[dict]) -> tuple[list[dict], dict]:
+        rows = []
+        pipeline.extract(source(repos, rows))
+        return rows, pipeline.state["sources"]["github"]
+
+    return extract
+
+
+def _repo(name: str, archived: bool = False) -> dict:
+    return {"name": name, "archived": archived}
+
+
+def test_issue_stats_records_first_responses(github_stub, extract_issues):
+    github_stub["issues"]["rnaseq"] = [_issue(1, comments=2), _issue(2, comments=0)]
+
+    rows, state = extract_issues([_repo("rnaseq")])
+
+    assert {row["issue_number"]: row["first_responder"] for row in rows} == {1: "responder", 2: None}
+    assert state["processed_issues"]["rnaseq"]["1"]["num_comments"] == 2
+    assert "rnaseq" in state["last_issue_check"]
+
+
+@pytest.mark.parametrize("skip_lookup", ["low_rate_limit", "lookup_fails"])
+def test_issue_stats_looks_up_skipped_first_responses_on_the_next_run(github_stub, extract_issues, skip_lookup):
+    github_stub["issues"]["rnaseq"] = [_issue(1, comments=2)]
+    if skip_lookup == "low_rate_limit":
+        github_stub["remaining"] = 100
+    else:
+        github_stub["lookup_fails"] = True
+
+    _, state = extract_issues([_repo("rnaseq")])
+    assert state["processed_issues"]["rnaseq"]["1"]["num_comments"] == 0
+    assert "rnaseq" not in state["last_issue_check"]
+
+    github_stub.update(remaining=5000, lookup_fails=False, lookups=[])
+    rows, state = extract_issues([_repo("rnaseq")])
+    assert github_stub["lookups"] == [[1]]
+    assert rows[0]["first_responder"] == "responder"
+    assert state["processed_issues"]["rnaseq"]["1"]["num_comments"] == 2
+
+
+def test_archived_repos_are_only_done_once_all_first_responses_were_looked_up(github_stub, extract_issues):
+    github_stub["issues"]["oldpipe"] = [_issue(1, comments=1)]
+    github_stub["lookup_fails"] = True
+
+    _, state = extract_issues([_repo("oldpipe", archived=True)])
+    assert state["archived_issue_repos"] == []
+
+    github_stub["lookup_fails"] = False
+    _, state = extract_issues([_repo("oldpipe", archived=True)])
+    assert state["archived_issue_repos"] == ["oldpipe"]
+
+    github_stub["urls"].clear()
+    rows, _ = extract_issues([_repo("oldpipe", archived=True)])
+    assert rows == []
+    assert github_stub["urls"] == []
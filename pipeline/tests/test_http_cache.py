@@ -0,0 +1,66 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from nf_core_stats._http_cache import ETagCache
+
+URL = "https://api.github.com/repos/nf-core/rnaseq/contents/nextflow.config"
+
+
+def _response(body: bytes, etag: str | None = '"abc"') -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    response.headers["Content-Type"] = "text/plain"
+    return response
+
+
+def test_round_trip(tmp_path):
+    cache = ETagCache(tmp_path / "cache.sqlite")
+    cache.put(URL, _response(b"manifest {}"), "application/vnd.github.raw+json")
+
+    cached = cache.get(URL, "application/vnd.github.raw+json")
+    assert cached.etag == '"abc"'
+    assert cached.body == b"manifest {}"
+
+    not_modified = requests.Response()
+    not_modified.status_code = 304
+    not_modified.url = URL
+    response = cached.to_response(not_modified)
+    assert response.status_code == 200
+    assert response.content == b"manifest {}"
+    assert response.headers["content-type"] == "text/plain"
+
+
+def test_entries_are_keyed_on_the_accept_header(tmp_path):
+    cache = ETagCache(tmp_path / "cache.sqlite")
+    cache.put(URL, _response(b"raw"), "application/vnd.github.raw+json")
+
+    assert cache.get(URL) is None
+    assert cache.get(URL, "application/vnd.github.raw+json").body == b"raw"
+
+
+def test_responses_without_etag_are_not_stored(tmp_path):
+    cache = ETagCache(tmp_path / "cache.sqlite")
+    cache.put(URL, _response(b"body", etag=None))
+
+    assert cache.get(URL) is None
+
+
+def test_stale_entries_are_evicted_on_open(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = ETagCache(path, max_age=timedelta(days=30))
+    cache.put(URL, _response(b"old"))
+    cache.put(f"{URL}?ref=dev", _response(b"recent"))
+    cache.touch(f"{URL}?ref=dev")
+
+    old = (datetime.now(timezone.utc) - timedelta(days=31)).isoformat()
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE etag_cache SET fetched_at = ? WHERE url = ?", (old, URL))
+
+    reopened = ETagCache(path, max_age=timedelta(days=30))
+    assert reopened.get(URL) is None
+    assert reopened.get(f"{URL}?ref=dev").body == b"recent"